@@ -8,6 +8,7 @@ from engine.core.repository_manager import RepositoryManager
 from engine.core.step_handlers import StepHandlers
 from engine.core.storage_manager import StorageManager
 from engine.core.sync_manager import SyncManager
+from engine.utils.input_handlers import InputHandler
 from engine.utils.text_decorator import (
     Colors,
     print_error,
@@ -84,6 +85,8 @@ class EnhancedSmartGitCLI(SmartGitCLI):
                     return
 
             if not self._run_step_with_retry(self.step3_users, "users", "Loading user configuration"):
+                if not self.running:
+                    return
                 print_error("No user selected")
                 return
 
@@ -128,37 +131,11 @@ class EnhancedSmartGitCLI(SmartGitCLI):
 
     @staticmethod
     def get_menu_choice(prompt: str, min_choice: int, max_choice: int):
-        while True:
-            try:
-                choice_str = input(f"\n{Colors.CYAN}{prompt} [{min_choice}-{max_choice}]: {Colors.END}").strip()
-
-                if not choice_str:
-                    print_error("Please enter a number")
-                    continue
-
-                choice = int(choice_str)
-
-                if min_choice <= choice <= max_choice:
-                    return choice
-                else:
-                    print_error(f"Please enter a number between {min_choice} and {max_choice}")
-
-            except ValueError:
-                print_error("Please enter a number")
-            except (KeyboardInterrupt, EOFError):
-                return 0
+        return InputHandler.get_menu_choice(prompt, min_choice, max_choice)
 
     @staticmethod
     def ask_yes_no(question: str) -> bool:
-        while True:
-            response = input(f"\n{Colors.CYAN}{question} (y/n): {Colors.END}").strip().lower()
-
-            if response in ['y', 'yes']:
-                return True
-            elif response in ['n', 'no']:
-                return False
-            else:
-                print_error("Please answer 'y' or 'n'")
+        return InputHandler.ask_yes_no(question)
 
     def ask_continue(self, question: str) -> bool:
         return self.ask_yes_no(question)
@@ -1,4 +1,7 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __version__ = 'v1.0.8'
 __copyright__ = "Copyright (©) 2026, Alexander Suvorov."
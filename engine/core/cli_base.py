@@ -1,18 +1,18 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-import ipaddress
-import socket
+import hashlib
+import logging
 import subprocess
 import sys
 import time
 import signal
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 
-import requests
 from smart_repository_manager_core.utils.file_ops import FileOperations
 
 from engine.ui.result_logger import ResultLogger
 from engine.ui.state_manager import UIStateManager
+from engine.utils.network_utils import NetworkUtils
 from engine.utils.text_decorator import (
     Colors,
     clear_screen,
@@ -34,12 +34,17 @@ from smart_repository_manager_core.services.sync_service import SyncService
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+log = logging.getLogger(__name__)
+
 
 class SmartGitCLI:
     def __init__(self, config_path: str = "config.json"):
         self.config_path = Path.home() / "smart_repository_manager" / config_path
         self.current_user: Optional[User] = None
         self.current_token: Optional[str] = None
+        self._repos_version = 0
+        self._need_update_cache: Optional[Tuple[int, List[Repository]]] = None
+        self._local_exist_cache: Optional[Tuple[int, List[Repository]]] = None
         self.repositories: List[Repository] = []
         self.structure_service = StructureService()
         self.git_service = GitService()
@@ -53,6 +58,11 @@ class SmartGitCLI:
         self._retry_counts: Dict[str, int] = {}
         self._max_retries = 3
 
+        self._github_services: Dict[str, GitHubService] = {}
+        self._token_cache: Dict[str, Tuple[float, Tuple[bool, Optional[User]]]] = {}
+        self._token_cache_ttl = 60.0
+        self._repos_cache: Dict[str, Tuple[float, List[Repository]]] = {}
+
         self.menu_stack = []
         self.current_menu = "main"
         self.running = True
@@ -61,14 +71,71 @@ class SmartGitCLI:
 
         self.print_header()
 
+    @property
+    def repositories(self) -> List[Repository]:
+        return self._repositories
+
+    @repositories.setter
+    def repositories(self, value: List[Repository]):
+        self._repositories = value
+        self.mark_repositories_changed()
+
+    def mark_repositories_changed(self):
+        self._repos_version += 1
+
+    def github_service_for(self, token: str) -> GitHubService:
+        service = self._github_services.get(token)
+        if service is None:
+            service = GitHubService(token)
+            self._github_services[token] = service
+        return service
+
+    def validate_token(self, token: str) -> Tuple[bool, Optional[User]]:
+        key = hashlib.sha256(token.encode()).hexdigest()
+        now = time.monotonic()
+
+        cached = self._token_cache.get(key)
+        if cached and now - cached[0] < self._token_cache_ttl:
+            return cached[1]
+
+        valid, user = self.github_service_for(token).validate_token()
+
+        if valid and user:
+            self._token_cache[key] = (now, (valid, user))
+
+        return valid, user
+
+    def fetch_repositories(self, token: str) -> Tuple[bool, List[Repository]]:
+        key = hashlib.sha256(token.encode()).hexdigest()
+        now = time.monotonic()
+
+        cached = self._repos_cache.get(key)
+        if cached and now - cached[0] < self._token_cache_ttl:
+            return True, cached[1]
+
+        success, repositories = self.github_service_for(token).fetch_user_repositories()
+
+        if success:
+            self._repos_cache[key] = (now, repositories)
+
+        return success, repositories
+
     def get_need_update_repos(self):
-        return [repo for repo in self.repositories if hasattr(repo, 'need_update') and repo.need_update]
+        cached = self._need_update_cache
+        if cached is None or cached[0] != self._repos_version:
+            repos = [repo for repo in self.repositories if hasattr(repo, 'need_update') and repo.need_update]
+            cached = self._need_update_cache = (self._repos_version, repos)
+        return cached[1]
 
     def get_need_update_repos_count(self):
         return len(self.get_need_update_repos())
 
     def get_local_exist_repos(self):
-        return [repo for repo in self.repositories if repo.local_exists]
+        cached = self._local_exist_cache
+        if cached is None or cached[0] != self._repos_version:
+            repos = [repo for repo in self.repositories if repo.local_exists]
+            cached = self._local_exist_cache = (self._repos_version, repos)
+        return cached[1]
 
     def get_local_exist_repos_count(self):
         return len(self.get_local_exist_repos())
@@ -85,6 +152,10 @@ class SmartGitCLI:
     def get_private_repos_count(self):
         return len(self.get_private_repos())
 
+    def request_exit(self) -> bool:
+        self.running = False
+        return False
+
     def _signal_handler(self, signum, frame):
         _ = signum, frame
         print(f"\n\n{Colors.RED}Interrupt signal received. Exiting...{Colors.END}")
@@ -102,7 +173,7 @@ class SmartGitCLI:
             )
             return needs_update
         except Exception as e:
-            print(e)
+            log.debug("needs-update check failed for %s: %s", repo.name, e)
             return False
 
     @staticmethod
@@ -132,8 +203,7 @@ class SmartGitCLI:
             return False
 
         try:
-            github_service = GitHubService(self.current_token)
-            success, repositories = github_service.fetch_user_repositories()
+            success, repositories = self.fetch_repositories(self.current_token)
 
             if success:
                 self.repositories = repositories
@@ -159,47 +229,9 @@ class SmartGitCLI:
                 icon = Icons.SUCCESS if value > 0 and key in ["cloned", "synced", "repaired", "updated"] else Icons.INFO
                 print(f"  {icon} {key.replace('_', ' ').title()}: {value}")
 
-    def get_external_ip(self) -> Optional[str]:
-
-        ip_services = [
-            "https://api.ipify.org",
-            "https://icanhazip.com",
-            "https://ident.me",
-            "https://checkip.amazonaws.com",
-            "https://ifconfig.me/ip"
-        ]
-
-        for service in ip_services:
-            try:
-                response = requests.get(service, timeout=3)
-                if response.status_code == 200:
-                    ip = response.text.strip()
-                    if self._is_valid_ip(ip):
-                        return ip
-            except Exception as e:
-                print(e)
-                continue
-
-        try:
-            hostname = socket.gethostname()
-            ip_address = socket.gethostbyname(hostname)
-            if self._is_valid_ip(ip_address):
-                return f"{ip_address} (local)"
-        except Exception as e:
-            print(e)
-            pass
-
-        return None
-
     @staticmethod
-    def _is_valid_ip(ip: str) -> bool:
-
-        try:
-            clean_ip = ip.split(' ')[0]
-            ipaddress.ip_address(clean_ip)
-            return True
-        except ValueError:
-            return False
+    def get_external_ip() -> Optional[str]:
+        return NetworkUtils.get_external_ip()
 
     def _run_step_with_retry(self, step_func: Callable, step_name: str, step_description: str,
                              max_retries: int = None) -> bool:
@@ -218,6 +250,8 @@ class SmartGitCLI:
                 if success:
                     print_success(f"{step_description} completed successfully")
                     return True
+                elif not self.running:
+                    return False
                 else:
                     retry_count += 1
                     self._retry_counts[step_name] += 1
@@ -11,10 +11,10 @@ from engine.utils.text_decorator import (
     print_success,
     print_error,
     wait_for_enter,
-    print_menu_item
+    print_menu_item,
+    frame_output
 )
 from smart_repository_manager_core.services.config_service import ConfigService
-from smart_repository_manager_core.services.github_service import GitHubService
 from smart_repository_manager_core.utils.helpers import Helpers
 
 from engine import __version__ as ver
@@ -29,53 +29,20 @@ class MenuHandlers:
         self.cli.current_menu = "main"
 
         while self.cli.running:
-            clear_screen()
-            print_section(f"Smart Repository Manager {ver}")
-
-            if not self.cli.current_user or not self.cli.repositories:
-                print_error("User or repositories not loaded.")
-                print_info("Please run the full checkup first.")
-                wait_for_enter()
-                return
-
-            print(f"\n{Colors.BOLD}📊 System Status:{Colors.END}")
-            print(f"  • {Icons.USER} User: {Colors.CYAN}{self.cli.current_user.username}{Colors.END}")
-            print(f"\n{Colors.BOLD}📊 Repositories Status:{Colors.END}")
-            print(
-                f"  • {Icons.REPO} Total repositories: {Colors.CYAN}{len(self.cli.repositories)}{Colors.END}")
-            print(
-                f"  • {Icons.FOLDER} Local repositories: {Colors.CYAN}"
-                f"{self.cli.get_local_exist_repos_count()}{Colors.END}")
-
-            if self.cli.ui_state.get('total_public', 0) > 0:
-                print(f"  • {Icons.NETWORK} Public repositories: {self.cli.get_public_repos_count()}")
+            loaded = bool(self.cli.current_user and self.cli.repositories)
 
-            if self.cli.ui_state.get('total_private', 0) > 0:
-                print(f"  • {Icons.LOCK} Private repositories: {self.cli.get_private_repos_count()}")
+            with frame_output():
+                print_section(f"Smart Repository Manager {ver}")
 
-            if self.cli.ui_state.get('total_archived', 0) > 0:
-                print(f"  • {Icons.STORAGE} Archived repositories: {self.cli.ui_state.get('total_archived')}")
+                if loaded:
+                    self._render_main_menu()
+                else:
+                    print_error("User or repositories not loaded.")
+                    print_info("Please run the full checkup first.")
 
-            print(f"  • {Icons.SYNC} Needs update: {Colors.YELLOW}"
-                  f"{self.cli.get_need_update_repos_count()}{Colors.END}")
-
-            print(f"\n{Colors.BOLD}🚀 Main Commands:{Colors.END}")
-            print_menu_item("1", "User Information", Icons.USER)
-            print_menu_item("2", "Token Information", Icons.KEY)
-            print_menu_item("3", "Repository Management", Icons.REPO)
-            print_menu_item("4", "Synchronization", Icons.SYNC)
-            print_menu_item("5", "Storage Management", Icons.STORAGE)
-            print_menu_item("6", "System Information", Icons.INFO)
-
-            print(f"\n{Colors.BOLD}⚙️  System:{Colors.END}")
-            print_menu_item("7", "Restart", Icons.CHECK)
-            print_menu_item("8", " Clean Log Files", Icons.DELETE)
-
-            print_menu_item("9", "Help / Quick Guide", Icons.INFO)
-            print_menu_item("10", "About", Icons.INFO)
-
-            print(f"\n{Colors.BOLD}{Colors.RED}0.{Colors.END} {Icons.EXIT} Exit")
-            print('=' * 60)
+            if not loaded:
+                wait_for_enter()
+                return
 
             choice = self.cli.get_menu_choice("Select option", 0, 10)
 
@@ -107,6 +74,46 @@ class MenuHandlers:
             elif choice == 10:
                 self.show_about()
 
+    def _render_main_menu(self):
+        print(f"\n{Colors.BOLD}📊 System Status:{Colors.END}")
+        print(f"  • {Icons.USER} User: {Colors.CYAN}{self.cli.current_user.username}{Colors.END}")
+        print(f"\n{Colors.BOLD}📊 Repositories Status:{Colors.END}")
+        print(
+            f"  • {Icons.REPO} Total repositories: {Colors.CYAN}{len(self.cli.repositories)}{Colors.END}")
+        print(
+            f"  • {Icons.FOLDER} Local repositories: {Colors.CYAN}"
+            f"{self.cli.get_local_exist_repos_count()}{Colors.END}")
+
+        if self.cli.ui_state.get('total_public', 0) > 0:
+            print(f"  • {Icons.NETWORK} Public repositories: {self.cli.get_public_repos_count()}")
+
+        if self.cli.ui_state.get('total_private', 0) > 0:
+            print(f"  • {Icons.LOCK} Private repositories: {self.cli.get_private_repos_count()}")
+
+        if self.cli.ui_state.get('total_archived', 0) > 0:
+            print(f"  • {Icons.STORAGE} Archived repositories: {self.cli.ui_state.get('total_archived')}")
+
+        print(f"  • {Icons.SYNC} Needs update: {Colors.YELLOW}"
+              f"{self.cli.get_need_update_repos_count()}{Colors.END}")
+
+        print(f"\n{Colors.BOLD}🚀 Main Commands:{Colors.END}")
+        print_menu_item("1", "User Information", Icons.USER)
+        print_menu_item("2", "Token Information", Icons.KEY)
+        print_menu_item("3", "Repository Management", Icons.REPO)
+        print_menu_item("4", "Synchronization", Icons.SYNC)
+        print_menu_item("5", "Storage Management", Icons.STORAGE)
+        print_menu_item("6", "System Information", Icons.INFO)
+
+        print(f"\n{Colors.BOLD}⚙️  System:{Colors.END}")
+        print_menu_item("7", "Restart", Icons.CHECK)
+        print_menu_item("8", " Clean Log Files", Icons.DELETE)
+
+        print_menu_item("9", "Help / Quick Guide", Icons.INFO)
+        print_menu_item("10", "About", Icons.INFO)
+
+        print(f"\n{Colors.BOLD}{Colors.RED}0.{Colors.END} {Icons.EXIT} Exit")
+        print('=' * 60)
+
     def show_user_info(self):
         clear_screen()
         print_section("USER INFORMATION")
@@ -151,7 +158,7 @@ class MenuHandlers:
             return
 
         try:
-            github_service = GitHubService(self.cli.current_token)
+            github_service = self.cli.github_service_for(self.cli.current_token)
             token_info = github_service.get_token_info()
 
             print(f"\n{Colors.BOLD}🔑 Token Details:{Colors.END}")
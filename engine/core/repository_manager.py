@@ -1,5 +1,6 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 import datetime
+import logging
 import shutil
 import subprocess
 import time
@@ -9,6 +10,7 @@ from smart_repository_manager_core.services.archive_creator import ArchiveCreato
 from smart_repository_manager_core.services.download_service import DownloadService
 from smart_repository_manager_core.services.sync_service import SyncService
 
+from engine.utils.file_utils import FileUtils
 from engine.utils.text_decorator import (
     Colors,
     clear_screen,
@@ -20,10 +22,13 @@ from engine.utils.text_decorator import (
     print_warning,
     wait_for_enter,
     print_menu_item,
-    print_table
+    print_table,
+    frame_output
 )
 from smart_repository_manager_core.utils.helpers import Helpers
 
+log = logging.getLogger(__name__)
+
 
 class RepositoryManager:
     def __init__(self, cli):
@@ -73,28 +78,8 @@ class RepositoryManager:
         self.cli.current_menu = "repositories"
 
         while self.cli.current_menu == "repositories":
-            clear_screen()
-            print_section("REPOSITORY MANAGEMENT")
-
-            print(f"\n{Colors.BOLD}📊 Repository Stats:{Colors.END}")
-            print(f"  • Total repositories: {len(self.cli.repositories)}")
-            print(f"  • Local repositories: {self.cli.get_local_exist_repos_count()}")
-            print(f"  • Needs update: {self.cli.get_need_update_repos_count()}")
-            print(f"  • Private repositories: {self.cli.get_private_repos_count()}")
-            print(f"  • Public repositories: {self.cli.get_public_repos_count()}")
-            print(f"  • Archived repositories: {self.cli.ui_state.get('total_archived', 0)}")
-            print(f"  • Forks: {self.cli.ui_state.get('total_forks', 0)}")
-
-            print(f"\n{Colors.BOLD}📋 Commands:{Colors.END}")
-            print_menu_item("1", "List All Repositories", Icons.LIST)
-            print_menu_item("2", "Search for Repository", Icons.SEARCH)
-            print_menu_item("3", "Language Statistics", Icons.LANGUAGE)
-            print_menu_item("4", "Check Single Repository", Icons.SEARCH)
-            print_menu_item("5", "Repository Health Check", Icons.CHECK)
-            print_menu_item("6", "Create Archive", Icons.STORAGE)
-
-            print(f"\n{Colors.BOLD}{Colors.BLUE}0.{Colors.END} {Icons.BACK} Back")
-            print('=' * 60)
+            with frame_output():
+                self._render_menu()
 
             choice = self.cli.get_menu_choice("Select option", 0, 6)
 
@@ -114,8 +99,32 @@ class RepositoryManager:
                 self.create_user_repositories_archive()
 
             if choice != 0:
+                self.cli.mark_repositories_changed()
                 wait_for_enter()
 
+    def _render_menu(self):
+        print_section("REPOSITORY MANAGEMENT")
+
+        print(f"\n{Colors.BOLD}📊 Repository Stats:{Colors.END}")
+        print(f"  • Total repositories: {len(self.cli.repositories)}")
+        print(f"  • Local repositories: {self.cli.get_local_exist_repos_count()}")
+        print(f"  • Needs update: {self.cli.get_need_update_repos_count()}")
+        print(f"  • Private repositories: {self.cli.get_private_repos_count()}")
+        print(f"  • Public repositories: {self.cli.get_public_repos_count()}")
+        print(f"  • Archived repositories: {self.cli.ui_state.get('total_archived', 0)}")
+        print(f"  • Forks: {self.cli.ui_state.get('total_forks', 0)}")
+
+        print(f"\n{Colors.BOLD}📋 Commands:{Colors.END}")
+        print_menu_item("1", "List All Repositories", Icons.LIST)
+        print_menu_item("2", "Search for Repository", Icons.SEARCH)
+        print_menu_item("3", "Language Statistics", Icons.LANGUAGE)
+        print_menu_item("4", "Check Single Repository", Icons.SEARCH)
+        print_menu_item("5", "Repository Health Check", Icons.CHECK)
+        print_menu_item("6", "Create Archive", Icons.STORAGE)
+
+        print(f"\n{Colors.BOLD}{Colors.BLUE}0.{Colors.END} {Icons.BACK} Back")
+        print('=' * 60)
+
     def list_all_repositories(self):
         clear_screen()
         print_section("LIST ALL REPOSITORIES")
@@ -281,7 +290,7 @@ class RepositoryManager:
                 else:
                     broken_count += 1
             except Exception as e:
-                print(e)
+                log.debug("git rev-parse failed for %s: %s", repo_path, e)
                 broken_count += 1
 
         print(f"\n{Colors.BOLD}Health Status:{Colors.END}")
@@ -509,7 +518,9 @@ class RepositoryManager:
 
         repo_path = Path.home() / "smart_repository_manager" / self.cli.current_user.username / "repositories" / repo.name
         if repo_path.exists():
-            shutil.rmtree(repo_path)
+            if not FileUtils.safe_delete_directory_parallel(repo_path):
+                print_error(f"Failed to delete {repo_path}")
+                return
             repo.local_exists = False
 
         self._clone_single_repository(repo)
@@ -1,18 +1,26 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-import shutil
-import sys
-import getpass
+import os
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 
 from engine.utils.text_decorator import Colors, print_info, print_menu_item, print_success, print_section
 from smart_repository_manager_core.services.config_service import ConfigService
-from smart_repository_manager_core.services.github_service import GitHubService
 
 from engine import __version__ as ver
 from engine import __copyright__ as copyright_
 
+_TOKEN_HELP = "\n".join((
+    f"\n  {Colors.YELLOW}GitHub Personal Access Token (PAT) required{Colors.END}",
+    "  To create token:",
+    "  1. Go to https://github.com/settings/tokens",
+    "  2. Click 'Generate new token'",
+    "  3. Select scopes: 'repo' (full repository access)",
+    "  4. Copy the generated token",
+    ""
+))
+
 
 class StepHandlers:
     def __init__(self, cli):
@@ -20,7 +28,6 @@ class StepHandlers:
 
     # Step 1
     def check_structure_step(self) -> bool:
-        time.sleep(1.0)
         self.cli.log_step(1, "Checking directory structure")
 
         try:
@@ -55,27 +62,19 @@ class StepHandlers:
                 print(f"  {Colors.YELLOW}⚠️ Base directory does not exist{Colors.END}")
                 print(f"  {Colors.YELLOW}  Will be created when working with user{Colors.END}")
 
-            test_user = "_test_check"
-            test_structure = self.cli.structure_service.create_user_structure(test_user)
+            probe_dir = base_dir if base_dir_exists else base_dir.parent
 
-            if test_structure:
-                success = self.cli.log_result(
-                    True,
-                    "Directory structure works",
-                    {
-                        "test_user": test_user,
-                        "directories": list(test_structure.keys()),
-                        "base_dir": str(base_dir)
-                    }
-                )
-
-                test_user_dir = base_dir / test_user
-                if test_user_dir.exists():
-                    shutil.rmtree(test_user_dir)
-            else:
-                return self.cli.log_result(False, "Failed to create structure")
+            if not os.access(probe_dir, os.W_OK | os.X_OK):
+                return self.cli.log_result(False, f"Directory is not writable: {probe_dir}")
 
-            return success
+            return self.cli.log_result(
+                True,
+                "Directory structure works",
+                {
+                    "writable_dir": str(probe_dir),
+                    "base_dir": str(base_dir)
+                }
+            )
 
         except Exception as e:
             return self.cli.log_result(False, f"Structure check error: {str(e)}")
@@ -164,10 +163,13 @@ class StepHandlers:
 
             while True:
 
-                print(f"\n  {Colors.BOLD}Current configuration:{Colors.END}")
-                print(f"    App: {config.app_name} {config.version}")
-                print(f"    Users: {len(config.users)}")
-                print(f"    Active user: {Colors.GREEN}{config.active_user or 'Not selected'}{Colors.END}")
+                print(
+                    f"\n  {Colors.BOLD}Current configuration:{Colors.END}",
+                    f"    App: {config.app_name} {config.version}",
+                    f"    Users: {len(config.users)}",
+                    f"    Active user: {Colors.GREEN}{config.active_user or 'Not selected'}{Colors.END}",
+                    sep="\n"
+                )
 
                 if config.users:
                     print(f"\n  {Colors.BOLD}Saved Users:{Colors.END}")
@@ -205,7 +207,7 @@ class StepHandlers:
 
                         print_section(f"{copyright_}")
 
-                        sys.exit(1)
+                        return self.cli.request_exit()
 
                     else:
                         if config.active_user:
@@ -229,16 +231,12 @@ class StepHandlers:
             return self.cli.log_result(False, f"User management error: {str(e)}")
 
     def add_new_user_step(self, config_service: ConfigService):
+        import getpass
+
         print(f"\n  {Colors.BOLD}Adding new GitHub user{Colors.END}")
 
         while True:
-            print(f"\n  {Colors.YELLOW}GitHub Personal Access Token (PAT) required{Colors.END}")
-            print("  To create token:")
-            print("  1. Go to https://github.com/settings/tokens")
-            print("  2. Click 'Generate new token'")
-            print("  3. Select scopes: 'repo' (full repository access)")
-            print("  4. Copy the generated token")
-            print()
+            print(_TOKEN_HELP)
 
             token = getpass.getpass(f"  {Colors.CYAN}Enter GitHub token: {Colors.END}").strip()
 
@@ -247,8 +245,7 @@ class StepHandlers:
                     return False
                 continue
 
-            github_service = GitHubService(token)
-            valid, user = github_service.validate_token()
+            valid, user = self.cli.validate_token(token)
 
             if valid and user:
                 config_service.add_user(user.username, token)
@@ -316,12 +313,20 @@ class StepHandlers:
             return self.cli.log_result(False, "No token set")
 
         try:
-            github_service = GitHubService(self.cli.current_token)
+            github_service = self.cli.github_service_for(self.cli.current_token)
 
-            valid, user = github_service.validate_token()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                validate_future = executor.submit(self.cli.validate_token, self.cli.current_token)
+                token_info_future = executor.submit(github_service.get_token_info)
+                limits_future = executor.submit(github_service.check_rate_limits)
 
-            if not valid or not user:
-                return self.cli.log_result(False, "Token invalid")
+                valid, user = validate_future.result()
+
+                if not valid or not user:
+                    return self.cli.log_result(False, "Token invalid")
+
+                token_info = token_info_future.result()
+                limits = limits_future.result()
 
             self.cli.current_user = user
 
@@ -341,8 +346,6 @@ class StepHandlers:
                 user_data
             )
 
-            token_info = github_service.get_token_info()
-
             token_data = {
                 "username": token_info.username,
                 "scopes": token_info.scopes or "Not specified",
@@ -357,14 +360,14 @@ class StepHandlers:
                 token_data
             )
 
-            limits = github_service.check_rate_limits()
-
             limits_data = {
                 "limit": limits.get("limit", "Unknown"),
                 "remaining": limits.get("remaining", "Unknown"),
             }
 
             if limits.get("reset"):
+                from datetime import datetime
+
                 try:
                     reset_time = datetime.fromtimestamp(int(limits["reset"]))
                     limits_data["reset_time"] = reset_time.strftime("%Y-%m-%d %H:%M:%S")
@@ -391,12 +394,10 @@ class StepHandlers:
             return self.cli.log_result(False, "User not set")
 
         try:
-            github_service = GitHubService(self.cli.current_token)
-
             print(f"\n  {Colors.YELLOW}Loading repositories for {self.cli.current_user.username}...{Colors.END}")
             print("  This may take a moment...")
 
-            success, repositories = github_service.fetch_user_repositories()
+            success, repositories = self.cli.fetch_repositories(self.cli.current_token)
 
             if not success:
                 return self.cli.log_result(False, "Failed to load repositories")
@@ -404,18 +405,23 @@ class StepHandlers:
             self.cli.repositories = repositories
 
             total = len(repositories)
-            private_count = sum(1 for r in repositories if r.private)
-            public_count = total - private_count
+            private_count = 0
+            forks_count = 0
+            archived_count = 0
+            languages = Counter()
 
-            forks_count = sum(1 for r in repositories if r.fork)
-            archived_count = sum(1 for r in repositories if r.archived)
-
-            languages = {}
             for repo in repositories:
+                if repo.private:
+                    private_count += 1
+                if repo.fork:
+                    forks_count += 1
+                if repo.archived:
+                    archived_count += 1
                 if repo.language:
-                    languages[repo.language] = languages.get(repo.language, 0) + 1
+                    languages[repo.language] += 1
 
-            top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:5]
+            public_count = total - private_count
+            top_languages = languages.most_common(5)
 
             data = {
                 "total": total,
@@ -465,15 +471,15 @@ class StepHandlers:
             )
 
             local_repos = []
+            repos_path_str = str(repos_path)
 
             for repo in self.cli.repositories:
-                repo_path = repos_path / repo.name
-
-                if repo_path.exists() and (repo_path / '.git').exists():
-                    repo.local_exists = True
+                repo.local_exists = os.path.isdir(os.path.join(repos_path_str, repo.name, '.git'))
+                if repo.local_exists:
                     local_repos.append(repo.name)
 
             local_count = len(local_repos)
+            self.cli.mark_repositories_changed()
 
             local_data = {
                 "total_repositories": len(self.cli.repositories),
@@ -510,8 +516,6 @@ class StepHandlers:
             if not user_structure or "repositories" not in user_structure:
                 return self.cli.log_result(False, "User structure not found")
 
-            repos_path = user_structure["repositories"]
-
             User = type('User', (), {})
             user_obj = User()
             user_obj.username = user
@@ -529,9 +533,7 @@ class StepHandlers:
 
             for repo in repositories:
 
-                repo_path = repos_path / repo.name
-
-                if not repo_path.exists() or not (repo_path / '.git').exists():
+                if not repo.local_exists:
                     repo.need_update = True
                     needs_update_count += 1
                     continue
@@ -546,6 +548,8 @@ class StepHandlers:
                 if needs_update:
                     needs_update_count += 1
 
+            self.cli.mark_repositories_changed()
+
             update_per = f"{(needs_update_count / len(repositories) * 100):.1f}%" if repositories else "0%"
 
             data = {
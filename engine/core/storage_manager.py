@@ -1,9 +1,19 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import io
+import os
 import shutil
-from typing import Dict, Any
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from contextlib import redirect_stdout
+from functools import partial
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 
 from smart_repository_manager_core.services.download_service import DownloadService
 
+from engine.utils.file_utils import FileUtils
 from engine.utils.text_decorator import (
     Colors,
     clear_screen,
@@ -14,25 +24,129 @@ from engine.utils.text_decorator import (
     print_error,
     print_warning,
     wait_for_enter,
-    print_menu_item, print_table
+    print_menu_item, print_table,
+    print_frame
 )
 
+_HDR_LOCAL = f"\n{Colors.BOLD}💾 Local Storage:{Colors.END}"
+_HDR_CMDS = f"\n{Colors.BOLD}🗑️ Commands:{Colors.END}"
+_HDR_BACK = f"\n{Colors.BOLD}{Colors.BLUE}0.{Colors.END} {Icons.BACK} Back"
+_HDR_DETAILS = f"\n{Colors.BOLD}Storage Details:{Colors.END}"
+_HDR_ADDITIONAL = f"\n{Colors.BOLD}Additional Information:{Colors.END}\n  • 1 MB = 1024 KB\n  • 1 GB = 1024 MB"
+_SEPARATOR = '=' * 60
+
+
+def _directory_size(path: str, cancel: Optional[threading.Event] = None) -> int:
+    total = 0
+    stack = [path]
+
+    while stack:
+        if cancel is not None and cancel.is_set():
+            break
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    return total
+
+
+def _scan_repos(repos_path: str, workers: int = 8, cancel: Optional[threading.Event] = None) -> Tuple[int, int]:
+    with os.scandir(repos_path) as it:
+        repo_dirs = [top.path for top in it if top.is_dir(follow_symlinks=False)]
+
+    if not repo_dirs:
+        return 0, 0
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(repo_dirs))) as executor:
+        total_size = sum(executor.map(partial(_directory_size, cancel=cancel), repo_dirs))
+
+    return len(repo_dirs), total_size
+
+
+def _count_repos(repos_path: str) -> int:
+    try:
+        with os.scandir(repos_path) as it:
+            return sum(1 for entry in it if entry.is_dir(follow_symlinks=False))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
 class StorageManager:
     def __init__(self, cli):
         self.cli = cli
         self.download_service = DownloadService()
 
+        self._info_cache: Optional[Dict[str, Any]] = None
+        self._info_cache_user: Optional[str] = None
+        self._info_cache_ts = 0.0
+        self._info_cache_ttl = 2.0
+        self._info_generation = 0
+
+        self._cached_user: Optional[str] = None
+        self._cached_repos_path: Optional[Path] = None
+
+        self._nonexist: Dict[str, float] = {}
+        self._nonexist_ttl = 1.0
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._size_future: Optional[Future] = None
+        self._walk_cancel = threading.Event()
+
     def show_storage_menu(self):
         self.cli.menu_stack.append(self.cli.current_menu)
         self.cli.current_menu = "storage"
+        self._size_future = None
 
-        while self.cli.current_menu == "storage":
-            clear_screen()
+        try:
+            while self.cli.current_menu == "storage":
+                if self._size_future is None:
+                    self._size_future = self._submit_size_walk()
+
+                try:
+                    storage_info = self._size_future.result(timeout=0.2)
+                except FuturesTimeoutError:
+                    storage_info = self._pending_storage_info()
+
+                print_frame(self._render_storage_menu(storage_info))
+
+                choice = self.cli.get_menu_choice("Select option", 0, 4)
+
+                if choice == 0:
+                    self.cli.current_menu = self.cli.menu_stack.pop()
+                elif choice == 1:
+                    self.delete_local_repository()
+                elif choice == 2:
+                    self.delete_all_repositories(storage_info if self._size_future.done() else None)
+                elif choice == 3:
+                    self.show_storage_info()
+                elif choice == 4:
+                    self.manage_downloaded_archives()
+
+                if choice in (1, 2):
+                    self.cli.mark_repositories_changed()
+
+                if choice != 0:
+                    wait_for_enter()
+        finally:
+            self._shutdown_executor()
+
+    @staticmethod
+    def _render_storage_menu(storage_info: Dict[str, Any]) -> str:
+        buffer = io.StringIO()
+
+        with redirect_stdout(buffer):
             print_section("STORAGE MANAGEMENT")
 
-            storage_info = self.get_storage_info()
-
-            print(f"\n{Colors.BOLD}💾 Local Storage:{Colors.END}")
+            print(_HDR_LOCAL)
             if 'error' in storage_info:
                 print_error(f"Error: {storage_info['error']}")
             else:
@@ -42,62 +156,111 @@ class StorageManager:
 
                 print(f"  • Path: {storage_info.get('path', 'N/A')}")
                 print(f"  • Exists: {'✓' if exists else '✗'}")
-                print(f"  • Size: {size_mb:.2f} MB")
-                print(f"  • Repositories: {repo_count}")
+                print(f"  • Size: {'…' if size_mb is None else f'{size_mb:.2f}'} MB")
+                print(f"  • Repositories: {'…' if repo_count is None else repo_count}")
 
-            print(f"\n{Colors.BOLD}🗑️ Commands:{Colors.END}")
+            print(_HDR_CMDS)
             print_menu_item("1", "Delete Repository", Icons.DELETE)
             print_menu_item("2", "Delete All Repos", Icons.DELETE)
             print_menu_item("3", "Storage Information", Icons.INFO)
             print_menu_item("4", "Manage Downloaded Archives", Icons.STORAGE)
 
-            print(f"\n{Colors.BOLD}{Colors.BLUE}0.{Colors.END} {Icons.BACK} Back")
-            print('=' * 60)
+            print(_HDR_BACK)
+            print(_SEPARATOR)
+
+        return buffer.getvalue()
+
+    def _get_repos_path(self) -> Optional[Path]:
+        username = self.cli.current_user.username
+
+        if self._cached_user != username or self._cached_repos_path is None:
+            structure = self.cli.structure_service.get_user_structure(username)
+            if "repositories" not in structure:
+                return None
+
+            self._cached_user = username
+            self._cached_repos_path = structure["repositories"]
+
+        return self._cached_repos_path
+
+    def _pending_storage_info(self) -> Dict[str, Any]:
+        if not self.cli.current_user:
+            return {"error": "No user selected"}
+
+        repos_path = self._get_repos_path()
+        if repos_path is None:
+            return {"error": "Storage structure not found"}
+
+        exists = self._exists(repos_path)
+
+        return {
+            "path": str(repos_path),
+            "exists": exists,
+            "repo_count": _count_repos(os.fspath(repos_path)) if exists else 0,
+            "total_size_mb": None if exists else 0
+        }
+
+    def _exists(self, path: Path) -> bool:
+        key = os.fspath(path)
+        missing_since = self._nonexist.get(key)
+
+        if missing_since is not None and time.monotonic() - missing_since < self._nonexist_ttl:
+            return False
 
-            choice = self.cli.get_menu_choice("Select option", 0, 4)
+        if path.exists():
+            self._nonexist.pop(key, None)
+            return True
 
-            if choice == 0:
-                self.cli.current_menu = self.cli.menu_stack.pop()
-            elif choice == 1:
-                self.delete_local_repository()
-            elif choice == 2:
-                self.delete_all_repositories()
-            elif choice == 3:
-                self.show_storage_info()
-            elif choice == 4:
-                self.manage_downloaded_archives()
+        self._nonexist[key] = time.monotonic()
+        return False
 
-            if choice != 0:
-                wait_for_enter()
+    def _submit_size_walk(self) -> Future:
+        if self._executor is None:
+            self._walk_cancel = threading.Event()
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor.submit(self.get_storage_info, self._walk_cancel)
 
-    def get_storage_info(self) -> Dict[str, Any]:
+    def _shutdown_executor(self):
+        if self._executor is None:
+            return
+
+        self._walk_cancel.set()
+        self._info_generation += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._size_future = None
+
+    def _invalidate_info_cache(self):
+        self._info_generation += 1
+        self._info_cache = None
+        self._size_future = None
+
+    def get_storage_info(self, cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
         if not self.cli.current_user:
             return {"error": "No user selected"}
 
-        structure = self.cli.structure_service.get_user_structure(self.cli.current_user.username)
-        if "repositories" not in structure:
+        username = self.cli.current_user.username
+        if (self._info_cache is not None and self._info_cache_user == username
+                and time.monotonic() - self._info_cache_ts < self._info_cache_ttl):
+            return self._info_cache
+
+        repos_path = self._get_repos_path()
+        if repos_path is None:
             return {"error": "Storage structure not found"}
 
-        repos_path = structure["repositories"]
+        generation = self._info_generation
+        exists = self._exists(repos_path)
 
         info = {
             "path": str(repos_path),
-            "exists": repos_path.exists(),
+            "exists": exists,
             "repo_count": 0,
             "total_size_mb": 0
         }
 
-        if repos_path.exists():
+        if exists:
             try:
-                repo_count = 0
-                total_size = 0
-
-                for item in repos_path.iterdir():
-                    if item.is_dir():
-                        repo_count += 1
-                        for file in item.rglob('*'):
-                            if file.is_file():
-                                total_size += file.stat().st_size
+                repo_count, total_size = _scan_repos(os.fspath(repos_path), cancel=cancel)
 
                 info["repo_count"] = repo_count
                 info["total_size_mb"] = total_size / (1024 * 1024)
@@ -105,6 +268,11 @@ class StorageManager:
             except Exception as e:
                 info["error"] = str(e)
 
+        if generation == self._info_generation:
+            self._info_cache = info
+            self._info_cache_user = username
+            self._info_cache_ts = time.monotonic()
+
         return info
 
     def delete_local_repository(self):
@@ -115,18 +283,19 @@ class StorageManager:
             print_error("No user selected")
             return
 
-        structure = self.cli.structure_service.get_user_structure(self.cli.current_user.username)
-        if "repositories" not in structure:
+        repos_path = self._get_repos_path()
+        if repos_path is None:
             print_error("Storage structure not found")
             return
 
-        repos_path = structure["repositories"]
+        try:
+            with os.scandir(os.fspath(repos_path)) as it:
+                on_disk = {entry.name for entry in it if entry.is_dir(follow_symlinks=False)}
+        except (FileNotFoundError, NotADirectoryError):
+            on_disk = set()
 
-        local_repos = []
-        for repo in self.cli.repositories:
-            repo_path = repos_path / repo.name
-            if repo_path.exists():
-                local_repos.append(repo)
+        repos = self.cli.repositories
+        local_repos = [repo for repo in repos if repo.name in on_disk]
 
         if not local_repos:
             print_info("No local repositories found")
@@ -142,30 +311,32 @@ class StorageManager:
             print_info("Deletion cancelled")
             return
 
-        repo_name = local_repos[choice - 1].name
+        selected_repo = local_repos[choice - 1]
+        repo_name = selected_repo.name
 
         if not self.cli.ask_yes_no(f"{Colors.RED}Delete repository '{repo_name}'? This cannot be undone!{Colors.END}"):
             print_info("Deletion cancelled")
             return
 
-        repo_path = repos_path / repo_name
+        repo_path = os.path.join(os.fspath(repos_path), repo_name)
 
         try:
-            if repo_path.exists():
-                shutil.rmtree(repo_path)
+            if os.path.exists(repo_path):
+                deleted = FileUtils.safe_delete_directory(repo_path)
+                self._invalidate_info_cache()
+                if not deleted:
+                    print_error(f"Error deleting repository: {repo_path}")
+                    return
                 print_success(f"Repository '{repo_name}' deleted successfully")
 
-                for repo in self.cli.repositories:
-                    if repo.name == repo_name:
-                        repo.local_exists = False
-                        repo.need_update = True
-                        break
+                selected_repo.local_exists = False
+                selected_repo.need_update = True
             else:
                 print_error(f"Repository '{repo_name}' not found")
         except Exception as e:
             print_error(f"Error deleting repository: {e}")
 
-    def delete_all_repositories(self):
+    def delete_all_repositories(self, storage_info: Optional[Dict[str, Any]] = None):
         clear_screen()
         print_section("DELETE ALL REPOSITORIES")
 
@@ -173,13 +344,19 @@ class StorageManager:
             print_error("No user selected")
             return
 
-        storage_info = self.get_storage_info()
-        repo_count = storage_info.get('repo_count', 0)
+        repos_path = self._get_repos_path()
+        if repos_path is None:
+            print_error("Storage structure not found")
+            return
+
+        repo_count = _count_repos(os.fspath(repos_path))
 
         if repo_count == 0:
             print_info("No local repositories found")
             return
 
+        if storage_info is None:
+            storage_info = self.get_storage_info()
         size_mb = storage_info.get('total_size_mb', 0)
 
         print_warning(f"⚠️ WARNING: This will delete ALL local repositories!")
@@ -192,21 +369,15 @@ class StorageManager:
             print_info("Deletion cancelled")
             return
 
-        structure = self.cli.structure_service.get_user_structure(self.cli.current_user.username)
-        if "repositories" not in structure:
-            print_error("Storage structure not found")
-            return
-
-        repos_path = structure["repositories"]
-
         deleted_count = 0
-        if repos_path.exists():
+        if self._exists(repos_path):
             try:
-                for item in repos_path.iterdir():
-                    if item.is_dir():
-                        shutil.rmtree(item, ignore_errors=True)
-                        deleted_count += 1
+                with os.scandir(os.fspath(repos_path)) as it:
+                    dirs = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+
+                deleted_count = FileUtils.delete_directories_parallel(dirs)
 
+                self._invalidate_info_cache()
                 print_success(f"Deleted {deleted_count} repositories")
 
                 for repo in self.cli.repositories:
@@ -222,27 +393,60 @@ class StorageManager:
         clear_screen()
         print_section("STORAGE INFORMATION")
 
-        storage_info = self.get_storage_info()
+        if not self.cli.current_user:
+            print_error("Error: No user selected")
+            return
 
-        if 'error' in storage_info:
-            print_error(f"Error: {storage_info['error']}")
+        repos_path = self._get_repos_path()
+        if repos_path is None:
+            print_error("Error: Storage structure not found")
             return
 
-        print(f"\n{Colors.BOLD}Storage Details:{Colors.END}")
-        print(f"  • Path: {storage_info.get('path', 'N/A')}")
-        print(f"  • Exists: {'✓' if storage_info.get('exists') else '✗'}")
-        print(f"  • Size: {storage_info.get('total_size_mb', 0):.2f} MB")
-        print(f"  • Repositories: {storage_info.get('repo_count', 0)}")
-
-        if storage_info.get('exists') and storage_info.get('repo_count', 0) > 0:
-            total_size_mb = storage_info.get('total_size_mb', 0)
-            repo_count = max(1, storage_info.get('repo_count', 1))
-            avg_size = total_size_mb / repo_count
-            print(f"  • Average per repo: {avg_size:.2f} MB")
-
-        print(f"\n{Colors.BOLD}Additional Information:{Colors.END}")
-        print(f"  • 1 MB = 1024 KB")
-        print(f"  • 1 GB = 1024 MB")
+        exists = self._exists(repos_path)
+
+        lines = [
+            _HDR_DETAILS,
+            f"  • Path: {repos_path}",
+            f"  • Exists: {'✓' if exists else '✗'}"
+        ]
+
+        if exists:
+            usage = shutil.disk_usage(repos_path)
+            lines.append(f"  • Repositories: {_count_repos(os.fspath(repos_path))}")
+            lines.append(
+                f"  • Filesystem used: {usage.used / (1024 ** 3):.2f} GB of {usage.total / (1024 ** 3):.2f} GB"
+            )
+
+            if self._size_future is not None and self._size_future.done():
+                cached_info = self._size_future.result()
+                if 'error' not in cached_info:
+                    lines.extend(self._format_size_lines(cached_info))
+
+        lines.append(_HDR_ADDITIONAL)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        if exists and self.cli.ask_yes_no("Recompute repository sizes?"):
+            self._invalidate_info_cache()
+            storage_info = self.get_storage_info()
+
+            if 'error' in storage_info:
+                print_error(f"Error: {storage_info['error']}")
+                return
+
+            sys.stdout.write("\n".join([_HDR_DETAILS, *self._format_size_lines(storage_info)]) + "\n")
+
+    @staticmethod
+    def _format_size_lines(storage_info: Dict[str, Any]) -> List[str]:
+        total_size_mb = storage_info.get('total_size_mb', 0)
+        repo_count = storage_info.get('repo_count', 0)
+
+        lines = [f"  • Size: {total_size_mb:.2f} MB"]
+
+        if repo_count > 0:
+            lines.append(f"  • Average per repo: {total_size_mb / repo_count:.2f} MB")
+
+        return lines
 
     def manage_downloaded_archives(self):
         clear_screen()
@@ -1,19 +1,24 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 import concurrent
+import itertools
+import logging
+import os
 import subprocess
-import threading
+import sys
 import time
 import json
-import shutil
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Tuple
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Tuple
 
 from smart_repository_manager_core.services.download_service import DownloadService
 from smart_repository_manager_core.services.structure_service import StructureService
 from smart_repository_manager_core.core.models.repository import Repository
 from smart_repository_manager_core.services.sync_service import SyncService
 
+from engine.utils.file_utils import FileUtils
 from engine.utils.text_decorator import (
     Colors,
     clear_screen,
@@ -23,16 +28,38 @@ from engine.utils.text_decorator import (
     print_error,
     print_warning,
     wait_for_enter,
-    print_menu_item
+    print_menu_item,
+    frame_output
 )
 
+log = logging.getLogger(__name__)
+
+
+def _list_repo_dirs(repos_path) -> Dict[str, str]:
+    try:
+        with os.scandir(repos_path) as it:
+            return {entry.name: entry.path for entry in it if entry.is_dir(follow_symlinks=False)}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
 
 class SyncManager:
+    _SYNC_WORKERS = 8
+
     def __init__(self, cli):
         self.cli = cli
         self.download_service = DownloadService()
         self.structure_service = StructureService()
         self._stop_download = False
+        self._stop_sync = False
+        self._cpu_count = getattr(self.download_service, 'cpu_count', os.cpu_count() or 4)
+        self._max_workers = getattr(self.download_service, 'max_workers', self._cpu_count)
+        self._repo_workers = max(1, self._cpu_count - 1)
+        self._structure_cache: Dict[str, Dict[str, Path]] = {}
+        self._last_progress_ts = 0.0
+        self._bar_chars_full = '█' * 40
+        self._bar_chars_empty = '░' * 40
+        self._home_dir = Path.home()
 
         self.sync_service = None
 
@@ -44,28 +71,14 @@ class SyncManager:
         self.cli.menu_stack.append(self.cli.current_menu)
         self.cli.current_menu = "sync"
 
-        while self.cli.current_menu == "sync":
-            clear_screen()
-            print_section("SYNCHRONIZATION")
+        counts = None
 
-            print(f"\n{Colors.BOLD}📊 Status:{Colors.END}")
-            print(f"  • Total repositories: {len(self.cli.repositories)}")
-            print(f"  • Local repositories: {self.cli.get_local_exist_repos_count()}")
-            print(f"  • Needs update: {self.cli.get_need_update_repos_count()}")
-
-            print(f"\n{Colors.BOLD}🔄 Git Operations:{Colors.END}")
-            print_menu_item("1", "Synchronize All (Git Clone/Pull)", Icons.SYNC)
-            print_menu_item("2", "Update Needed Only (Git Pull)", Icons.SYNC)
-            print_menu_item("3", "Clone Missing Only (Git Clone)", Icons.DOWNLOAD)
-            print_menu_item("4", "Sync with Repair", Icons.SETTINGS)
-            print_menu_item("5", "Re-clone All (Git Clone)", Icons.SETTINGS)
-
-            print(f"\n{Colors.BOLD}📦 Download Operations (ZIP):{Colors.END}")
-            print_menu_item("6", "Download All Repositories", Icons.DOWNLOAD)
-            print_menu_item("7", "Download Single Repository", Icons.DOWNLOAD)
+        while self.cli.current_menu == "sync":
+            if counts is None:
+                counts = (self.cli.get_local_exist_repos_count(), self.cli.get_need_update_repos_count())
 
-            print(f"\n{Colors.BOLD}{Colors.BLUE}0.{Colors.END} {Icons.BACK} Back")
-            print('=' * 60)
+            with frame_output():
+                self._render_menu(*counts)
 
             choice = self.cli.get_menu_choice("Select option", 0, 7)
 
@@ -86,14 +99,49 @@ class SyncManager:
             elif choice == 7:
                 self.download_single_repository()
 
+            if 1 <= choice <= 5:
+                self.cli.mark_repositories_changed()
+                counts = None
+
             if choice != 0:
                 wait_for_enter()
 
+    def _render_menu(self, local_count: int, need_update: int):
+        print_section("SYNCHRONIZATION")
+
+        print(f"\n{Colors.BOLD}📊 Status:{Colors.END}")
+        print(f"  • Total repositories: {len(self.cli.repositories)}")
+        print(f"  • Local repositories: {local_count}")
+        print(f"  • Needs update: {need_update}")
+
+        print(f"\n{Colors.BOLD}🔄 Git Operations:{Colors.END}")
+        print_menu_item("1", "Synchronize All (Git Clone/Pull)", Icons.SYNC)
+        print_menu_item("2", "Update Needed Only (Git Pull)", Icons.SYNC)
+        print_menu_item("3", "Clone Missing Only (Git Clone)", Icons.DOWNLOAD)
+        print_menu_item("4", "Sync with Repair", Icons.SETTINGS)
+        print_menu_item("5", "Re-clone All (Git Clone)", Icons.SETTINGS)
+
+        print(f"\n{Colors.BOLD}📦 Download Operations (ZIP):{Colors.END}")
+        print_menu_item("6", "Download All Repositories", Icons.DOWNLOAD)
+        print_menu_item("7", "Download Single Repository", Icons.DOWNLOAD)
+
+        print(f"\n{Colors.BOLD}{Colors.BLUE}0.{Colors.END} {Icons.BACK} Back")
+        print('=' * 60)
+
+    def _get_user_structure(self) -> Dict[str, Path]:
+        username = self.cli.current_user.username
+        structure = self._structure_cache.get(username)
+        if structure is None:
+            structure = self.structure_service.get_user_structure(username)
+            if structure:
+                self._structure_cache[username] = structure
+        return structure
+
     def _get_logs_dir(self) -> Path:
         if not self.cli.current_user:
-            return Path.home() / "smart_repository_manager" / "logs" / "sync"
+            return self._home_dir / "smart_repository_manager" / "logs" / "sync"
 
-        return Path.home() / "smart_repository_manager" / self.cli.current_user.username / "logs" / "sync"
+        return self._home_dir / "smart_repository_manager" / self.cli.current_user.username / "logs" / "sync"
 
     def _save_sync_log(self, operation_name: str, stats: dict):
         logs_dir = self._get_logs_dir()
@@ -103,12 +151,12 @@ class SyncManager:
         safe_op_name = operation_name.lower().replace(" ", "_")
         log_file = logs_dir / f"{safe_op_name}_{timestamp}.json"
 
-        clean_stats = {k: v for k, v in stats.items() if k != 'durations'}
+        clean_stats = stats if 'durations' not in stats else {k: v for k, v in stats.items() if k != 'durations'}
+
+        for result in clean_stats.get('results') or ():
+            result.pop('duration', None)
 
-        if 'results' in clean_stats and clean_stats['results']:
-            for result in clean_stats['results']:
-                if 'duration' in result:
-                    del result['duration']
+        self.cli.mark_repositories_changed()
 
         log_data = {
             "operation": operation_name,
@@ -120,25 +168,38 @@ class SyncManager:
             "repositories_needs_update": self.cli.get_need_update_repos_count() if self.cli.current_user else 0
         }
 
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False)
+        payload = json.dumps(log_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        with open(log_file, 'wb', buffering=65536) as f:
+            f.write(payload)
 
         print_info(f"\n📝 Log saved: {log_file}")
 
+    @staticmethod
+    def _print_repo_list(repos: List[Repository]):
+        sys.stdout.write("".join([f"  {i}. {repo.name}\n" for i, repo in enumerate(repos, 1)]))
+        sys.stdout.flush()
+
+    def _progress_due(self, completed: int, total: int) -> bool:
+        return completed == total or time.monotonic() - self._last_progress_ts >= 0.05
+
     def _show_progress(self, completed: int, total: int, current_item: str, operation: str = "Processing"):
+        if not self._progress_due(completed, total):
+            return
+        self._last_progress_ts = time.monotonic()
+
         progress_pct = (completed / total) * 100
-        bar_length = 40
-        filled_length = int(bar_length * completed // total)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
+        filled_length = int(40 * completed // total)
+        bar = self._bar_chars_full[:filled_length] + self._bar_chars_empty[filled_length:]
 
         status_color = Colors.GREEN if completed == total else Colors.CYAN
 
-        print(
-            f"\r{status_color}{operation}: |{bar}| {completed}/{total} ({progress_pct:.1f}%) - Current: {current_item}{Colors.END}",
-            end='', flush=True)
-
+        line = f"\r{status_color}{operation}: |{bar}| {completed}/{total} ({progress_pct:.1f}%) - Current: {current_item}{Colors.END}"
         if completed == total:
-            print()
+            line += "\n"
+
+        sys.stdout.write(line)
+        sys.stdout.flush()
 
     def _sync_single_repository(self, repo: Repository, operation: str = "sync") -> Tuple[bool, str, float]:
         self._ensure_sync_service()
@@ -160,7 +221,7 @@ class SyncManager:
             )
 
             if success:
-                user_structure = self.structure_service.get_user_structure(self.cli.current_user.username)
+                user_structure = self._get_user_structure()
                 if user_structure and "repositories" in user_structure:
                     repos_path = user_structure["repositories"]
                     repo_path = repos_path / repo.name
@@ -173,6 +234,77 @@ class SyncManager:
         except Exception as e:
             return False, f"Error: {str(e)}", 0.0
 
+    def _sync_one(self, repo: Repository, action: str) -> Tuple[bool, str, float]:
+        if self._stop_sync:
+            return False, "Sync stopped by user", 0.0
+
+        return self._sync_single_repository(repo, action)
+
+    def _reclone_one(self, repo: Repository, repos_path: Path) -> Tuple[bool, str, float]:
+        if self._stop_sync:
+            return False, "Sync stopped by user", 0.0
+
+        FileUtils.safe_delete_directory_parallel(repos_path / repo.name, workers=4)
+
+        return self._sync_single_repository(repo, "clone")
+
+    def _iter_parallel(self, repo_list: List[Repository], worker: Callable[[Repository], Tuple[bool, str, float]],
+                       label: str, operation: str) -> Iterator[Tuple[Repository, bool, str]]:
+        self._ensure_sync_service()
+        self._stop_sync = False
+
+        total = len(repo_list)
+        completed = 0
+
+        max_workers = self._SYNC_WORKERS
+        window = max_workers * 2
+        pending = iter(repo_list)
+        in_flight = {}
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        finished = False
+
+        def fill():
+            while len(in_flight) < window and not self._stop_sync:
+                repo = next(pending, None)
+                if repo is None:
+                    return
+                in_flight[executor.submit(worker, repo)] = repo
+
+        try:
+            fill()
+            while in_flight:
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                for future in done:
+                    repo = in_flight.pop(future)
+
+                    try:
+                        success, message, _ = future.result()
+                    except Exception as e:
+                        success, message = False, f"Error: {str(e)}"
+
+                    completed += 1
+                    if not success or self._progress_due(completed, total):
+                        print(f"\n[{completed}/{total}] {label}: {repo.name}")
+                    self._show_progress(completed, total, repo.name, operation)
+
+                    yield repo, success, message
+
+                fill()
+
+            finished = True
+
+        except KeyboardInterrupt:
+            print_warning("\n\nSync interrupted by user")
+
+        finally:
+            if finished:
+                executor.shutdown(wait=True)
+            else:
+                self._stop_sync = True
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def download_all_repositories(self):
         clear_screen()
         print_section("DOWNLOAD ALL REPOSITORIES")
@@ -181,12 +313,14 @@ class SyncManager:
             print_error("User or repositories not loaded")
             return
 
-        cpu_count = getattr(self.download_service, 'cpu_count', 4)
-        repo_workers = max(1, cpu_count - 1)
+        repositories = self.cli.repositories
+        total = len(repositories)
+        cpu_count = self._cpu_count
+        repo_workers = self._repo_workers
 
         print(f"\n{Colors.BOLD}📊 Download Information:{Colors.END}")
         print(f"  • User: {Colors.CYAN}{self.cli.current_user.username}{Colors.END}")
-        print(f"  • Repositories to download: {len(self.cli.repositories)}")
+        print(f"  • Repositories to download: {total}")
         print(f"  • Download mode: {Colors.GREEN}ALL BRANCHES for each repo{Colors.END}")
         print(f"  • CPU cores detected: {cpu_count}")
         print(f"  • Repo downloads: {repo_workers} threads")
@@ -200,7 +334,7 @@ class SyncManager:
             return
 
         print(
-            f"\n{Colors.YELLOW}Starting download of {len(self.cli.repositories)} repositories...{Colors.END}")
+            f"\n{Colors.YELLOW}Starting download of {total} repositories...{Colors.END}")
         print_info(f"Using {repo_workers} workers for repository downloads\n")
 
         self._stop_download = False
@@ -212,12 +346,13 @@ class SyncManager:
             "total_size_mb": 0,
             "total_branches": 0,
             "results": [],
-            "total": len(self.cli.repositories),
+            "total": total,
             "successful": 0
         }
 
-        lock = threading.Lock()
         completed = 0
+        downloaded = failed = total_branches_sum = 0
+        total_size_mb = 0.0
 
         def download_single_repo(repo):
             if self._stop_download:
@@ -267,63 +402,57 @@ class SyncManager:
         with concurrent.futures.ThreadPoolExecutor(max_workers=repo_workers) as executor:
             future_to_repo = {
                 executor.submit(download_single_repo, repo): repo
-                for repo in self.cli.repositories
+                for repo in repositories
             }
 
             try:
                 for future in concurrent.futures.as_completed(future_to_repo):
                     if self._stop_download:
-                        for f in future_to_repo:
-                            f.cancel()
+                        executor.shutdown(wait=False, cancel_futures=True)
                         break
 
                     repo = future_to_repo[future]
 
                     try:
-                        repo_result = future.result(timeout=300)
-
-                        with lock:
-                            completed += 1
-                            stats['results'].append(repo_result)
-
-                            self._show_progress(completed, len(self.cli.repositories), repo.name, "Downloading")
-
-                            if repo_result.get('success'):
-                                successful_branches = repo_result.get('result', {}).get('successful', 0)
-                                total_branches = repo_result.get('result', {}).get('total_branches', 0)
-                                size_mb = repo_result.get('result', {}).get('total_size_bytes', 0) / (1024 * 1024)
-
-                                stats['downloaded'] += 1
-                                stats['successful'] += 1
-                                stats['total_branches'] += successful_branches
-                                stats['total_size_mb'] += size_mb
-
-                                print_success(
-                                    f"\n✓ {repo.name}: {successful_branches}/{total_branches} branches "
-                                    f"({size_mb:.2f} MB)"
-                                )
-                            else:
-                                stats['failed'] += 1
-                                error_msg = repo_result.get('error', 'Unknown error')
-                                print_error(f"\n✗ {repo.name}: {error_msg}")
-
-                    except concurrent.futures.TimeoutError:
-                        with lock:
-                            completed += 1
-                            stats['failed'] += 1
-                            print_error(f"\n✗ {repo.name}: Download timeout after 5 minutes")
+                        repo_result = future.result()
+
+                        completed += 1
+                        stats['results'].append(repo_result)
+
+                        self._show_progress(completed, total, repo.name, "Downloading")
+
+                        if repo_result.get('success'):
+                            successful_branches = repo_result.get('result', {}).get('successful', 0)
+                            total_branches = repo_result.get('result', {}).get('total_branches', 0)
+                            size_mb = repo_result.get('result', {}).get('total_size_bytes', 0) / (1024 * 1024)
+
+                            downloaded += 1
+                            total_branches_sum += successful_branches
+                            total_size_mb += size_mb
+
+                            print_success(
+                                f"\n✓ {repo.name}: {successful_branches}/{total_branches} branches "
+                                f"({size_mb:.2f} MB)"
+                            )
+                        else:
+                            failed += 1
+                            error_msg = repo_result.get('error', 'Unknown error')
+                            print_error(f"\n✗ {repo.name}: {error_msg}")
 
                     except Exception as e:
-                        with lock:
-                            completed += 1
-                            stats['failed'] += 1
-                            print_error(f"\n✗ {repo.name}: {str(e)}")
+                        completed += 1
+                        failed += 1
+                        print_error(f"\n✗ {repo.name}: {str(e)}")
 
             except KeyboardInterrupt:
                 print_warning("\n\nDownload interrupted by user")
                 self._stop_download = True
-                for future in future_to_repo:
-                    future.cancel()
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        stats['downloaded'] = stats['successful'] = downloaded
+        stats['failed'] = failed
+        stats['total_branches'] = total_branches_sum
+        stats['total_size_mb'] = total_size_mb
 
         self._show_download_summary(stats)
         self._save_sync_log("Download All Repositories", stats)
@@ -344,13 +473,15 @@ class SyncManager:
         print(f"  {Icons.STORAGE} Total branches: {stats['total_branches']}")
         print(f"  {Icons.STORAGE} Total size: {stats['total_size_mb']:.2f} MB")
 
-        failed_results = [r for r in stats['results'] if not r.get('success')]
-        if failed_results:
+        failed_iter = (r for r in stats['results'] if not r.get('success'))
+        failed_head = list(itertools.islice(failed_iter, 5))
+        if failed_head:
             print(f"\n{Colors.BOLD}{Colors.RED}Failed downloads:{Colors.END}")
-            for result in failed_results[:5]:
+            for result in failed_head:
                 print(f"  • {result['repo']}: {result.get('error', 'Unknown error')}")
-            if len(failed_results) > 5:
-                print(f"  • ... and {len(failed_results) - 5} more")
+            remaining = sum(1 for _ in failed_iter)
+            if remaining:
+                print(f"  • ... and {remaining} more")
 
     def download_single_repository(self):
         clear_screen()
@@ -361,8 +492,7 @@ class SyncManager:
             return
 
         print(f"\n{Colors.BOLD}Available repositories:{Colors.END}")
-        for i, repo in enumerate(self.cli.repositories, 1):
-            print(f"  {i}. {repo.name}")
+        self._print_repo_list(self.cli.repositories)
 
         choice = self.cli.get_menu_choice(f"\nSelect repository (0 to cancel)", 0, len(self.cli.repositories))
 
@@ -374,8 +504,8 @@ class SyncManager:
         clear_screen()
         print_section(f"DOWNLOAD: {repo.name}")
 
-        cpu_count = getattr(self.download_service, 'cpu_count', 'N/A')
-        max_workers = getattr(self.download_service, 'max_workers', 'N/A')
+        cpu_count = self._cpu_count
+        max_workers = self._max_workers
 
         print(f"\n{Colors.BOLD}Repository Information:{Colors.END}")
         print(f"  • Name: {repo.name}")
@@ -422,7 +552,7 @@ class SyncManager:
                             branch_size = branch_result['result'].get('size_bytes', 0) / (1024 * 1024)
                             branches.append((branch_name, branch_size))
 
-                    branches.sort(key=lambda x: x[1], reverse=True)
+                    branches.sort(key=itemgetter(1), reverse=True)
 
                     for branch_name, branch_size in branches:
                         print(f"  • {branch_name}: {branch_size:.2f} MB")
@@ -477,7 +607,7 @@ class SyncManager:
         clear_screen()
         print_section("RE-CLONE ALL REPOSITORIES")
 
-        structure = self.structure_service.get_user_structure(self.cli.current_user.username)
+        structure = self._get_user_structure()
         if "repositories" not in structure:
             print_error("Storage structure not found")
             return
@@ -486,8 +616,7 @@ class SyncManager:
         repos_path = structure['repositories']
 
         print(f"\n{Colors.BOLD}Found {len(repo_list)} repositories:{Colors.END}")
-        for i, repo in enumerate(repo_list, 1):
-            print(f"  {i}. {repo.name}")
+        self._print_repo_list(repo_list)
 
         if not self.cli.ask_yes_no(f"\nRe-clone {len(repo_list)} repositories?"):
             return
@@ -503,15 +632,9 @@ class SyncManager:
             "results": []
         }
 
-        for i, repo in enumerate(repo_list, 1):
-            print(f"\n[{i}/{len(repo_list)}] Re-clone: {repo.name}")
-            self._show_progress(i, len(repo_list), repo.name, "Re-cloning")
-
-            repo_path = repos_path / repo.name
-            if repo_path.exists():
-                shutil.rmtree(repo_path, ignore_errors=True)
+        worker = partial(self._reclone_one, repos_path=repos_path)
 
-            success, message, _ = self._sync_single_repository(repo, "clone")
+        for repo, success, message in self._iter_parallel(repo_list, worker, "Re-clone", "Re-cloning"):
 
             result = {
                 "repo": repo.name,
@@ -528,6 +651,7 @@ class SyncManager:
                 print_error(f"✗ Failed: {message}")
                 stats["failed"] += 1
 
+        self._structure_cache.pop(self.cli.current_user.username, None)
         self.cli.show_sync_summary(stats, "Re-cloning")
         self._save_sync_log("Re-clone All Repositories", stats)
 
@@ -535,7 +659,7 @@ class SyncManager:
         clear_screen()
         print_section("SYNC ALL REPOSITORIES")
 
-        structure = self.structure_service.get_user_structure(self.cli.current_user.username)
+        structure = self._get_user_structure()
         if "repositories" not in structure:
             print_error("Storage structure not found")
             return
@@ -543,8 +667,7 @@ class SyncManager:
         repo_list = self.cli.repositories
 
         print(f"\n{Colors.BOLD}Found {len(repo_list)} repositories:{Colors.END}")
-        for i, repo in enumerate(repo_list, 1):
-            print(f"  {i}. {repo.name}")
+        self._print_repo_list(repo_list)
 
         if not self.cli.ask_yes_no(f"\nSync {len(repo_list)} repositories?"):
             return
@@ -560,20 +683,19 @@ class SyncManager:
             "results": []
         }
 
-        for i, repo in enumerate(repo_list, 1):
-            print(f"\n[{i}/{len(repo_list)}] Sync: {repo.name}")
-            self._show_progress(i, len(repo_list), repo.name, "Syncing")
+        actions = {
+            repo.name: "pull" if (hasattr(repo, 'local_exists') and repo.local_exists) else "clone"
+            for repo in repo_list
+        }
 
-            if hasattr(repo, 'local_exists') and repo.local_exists:
-                success, message, _ = self._sync_single_repository(repo, "pull")
-            else:
-                success, message, _ = self._sync_single_repository(repo, "clone")
+        for repo, success, message in self._iter_parallel(
+                repo_list, lambda r: self._sync_one(r, actions[r.name]), "Sync", "Syncing"):
 
             result = {
                 "repo": repo.name,
                 "success": success,
                 "message": message,
-                "action": "pull" if (hasattr(repo, 'local_exists') and repo.local_exists) else "clone"
+                "action": actions[repo.name]
             }
             stats["results"].append(result)
 
@@ -606,14 +728,13 @@ class SyncManager:
             print('All repositories are up to date...')
             return
 
-        structure = self.structure_service.get_user_structure(self.cli.current_user.username)
+        structure = self._get_user_structure()
         if "repositories" not in structure:
             print_error("Storage structure not found")
             return
 
         print(f"\n{Colors.BOLD}Found {len(repo_list)} repositories:{Colors.END}")
-        for i, repo in enumerate(repo_list, 1):
-            print(f"  {i}. {repo.name}")
+        self._print_repo_list(repo_list)
 
         if not self.cli.ask_yes_no(f"\nUpdate {len(repo_list)} repositories?"):
             return
@@ -626,11 +747,8 @@ class SyncManager:
             "results": []
         }
 
-        for i, repo in enumerate(repo_list, 1):
-            print(f"\n[{i}/{len(repo_list)}] Updating: {repo.name}")
-            self._show_progress(i, len(repo_list), repo.name, "Updating")
-
-            success, message, _ = self._sync_single_repository(repo, "pull")
+        for repo, success, message in self._iter_parallel(
+                repo_list, lambda r: self._sync_one(r, "pull"), "Updating", "Updating"):
 
             result = {
                 "repo": repo.name,
@@ -658,17 +776,18 @@ class SyncManager:
             print_error("User or repositories not loaded")
             return
 
-        structure = self.structure_service.get_user_structure(self.cli.current_user.username)
+        structure = self._get_user_structure()
         if "repositories" not in structure:
             print_error("Storage structure not found")
             return
 
         repos_path = structure["repositories"]
+        present = _list_repo_dirs(repos_path)
         missing_repos = []
 
         for repo in self.cli.repositories:
-            repo_path = repos_path / repo.name
-            if not repo_path.exists() or not (repo_path / '.git').exists():
+            entry_path = present.get(repo.name)
+            if entry_path is None or not os.path.isdir(os.path.join(entry_path, '.git')):
                 missing_repos.append(repo)
 
         if not missing_repos:
@@ -676,8 +795,7 @@ class SyncManager:
             return
 
         print(f"\n{Colors.BOLD}Found {len(missing_repos)} missing repositories:{Colors.END}")
-        for i, repo in enumerate(missing_repos, 1):
-            print(f"  {i}. {repo.name}")
+        self._print_repo_list(missing_repos)
 
         if not self.cli.ask_yes_no(f"\nClone {len(missing_repos)} missing repositories?"):
             return
@@ -692,11 +810,8 @@ class SyncManager:
             "results": []
         }
 
-        for i, repo in enumerate(missing_repos, 1):
-            print(f"\n[{i}/{len(missing_repos)}] Cloning: {repo.name}")
-            self._show_progress(i, len(missing_repos), repo.name, "Cloning")
-
-            success, message, _ = self._sync_single_repository(repo, "clone")
+        for repo, success, message in self._iter_parallel(
+                missing_repos, lambda r: self._sync_one(r, "clone"), "Cloning", "Cloning"):
 
             result = {
                 "repo": repo.name,
@@ -717,9 +832,41 @@ class SyncManager:
                 print_error(f"✗ Failed: {message}")
                 stats["failed"] += 1
 
+        self._structure_cache.pop(self.cli.current_user.username, None)
         self.cli.show_sync_summary(stats, "Cloning")
         self._save_sync_log("Clone Missing Repositories", stats)
 
+    @staticmethod
+    def _is_valid_git_repo(repo_path: Path) -> bool:
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(repo_path), 'rev-parse', '--git-dir'],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            return result.returncode == 0
+        except Exception as e:
+            log.debug("git rev-parse failed for %s: %s", repo_path, e)
+            return False
+
+    @classmethod
+    def _is_repo_healthy(cls, repo_path: str) -> bool:
+        git_dir = os.path.join(repo_path, '.git')
+        if not (os.path.isdir(os.path.join(git_dir, 'objects')) and os.path.isdir(os.path.join(git_dir, 'refs'))):
+            return False
+
+        try:
+            with open(os.path.join(git_dir, 'HEAD'), 'rb') as f:
+                head = f.read(64).strip()
+        except OSError:
+            return False
+
+        if head.startswith(b'ref: refs/') or (len(head) in (40, 64) and all(c in b'0123456789abcdef' for c in head)):
+            return True
+
+        return cls._is_valid_git_repo(Path(repo_path))
+
     def sync_with_repair(self):
         clear_screen()
         print_section("SYNC WITH REPAIR")
@@ -734,66 +881,60 @@ class SyncManager:
         if not self.cli.ask_yes_no("Continue with repair sync?"):
             return
 
-        structure = self.structure_service.get_user_structure(self.cli.current_user.username)
+        structure = self._get_user_structure()
         if "repositories" not in structure:
             print_error("Storage structure not found")
             return
 
         repos_path = structure["repositories"]
 
+        repositories = self.cli.repositories
+        total = len(repositories)
+        present = _list_repo_dirs(repos_path)
         broken_repos = []
-        for repo in self.cli.repositories:
-            repo_path = repos_path / repo.name
-            if repo_path.exists():
-                if not (repo_path / '.git').exists():
+        candidates = []
+        for repo in repositories:
+            entry_path = present.get(repo.name)
+            if entry_path is not None:
+                if not os.path.isdir(os.path.join(entry_path, '.git')):
                     broken_repos.append(repo)
                 else:
-                    try:
-                        result = subprocess.run(
-                            ['git', '-C', str(repo_path), 'rev-parse', '--git-dir'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        if result.returncode != 0:
-                            broken_repos.append(repo)
-                    except Exception as e:
-                        print(e)
-                        broken_repos.append(repo)
+                    candidates.append(repo)
+
+        broken_repos.extend(repo for repo in candidates if not self._is_repo_healthy(present[repo.name]))
 
         if broken_repos:
             print(f"\n{Colors.BOLD}Found {len(broken_repos)} broken repositories:{Colors.END}")
-            for i, repo in enumerate(broken_repos, 1):
-                print(f"  {i}. {repo.name}")
+            self._print_repo_list(broken_repos)
 
-        print_info(f"\nStarting repair sync for {len(self.cli.repositories)} repositories...")
+        print_info(f"\nStarting repair sync for {total} repositories...")
 
         stats = {
             "synced": 0,
             "failed": 0,
             "skipped": 0,
             "repaired": 0,
-            "total": len(self.cli.repositories),
+            "total": total,
             "successful": 0,
             "results": []
         }
 
-        for i, repo in enumerate(self.cli.repositories, 1):
-            print(f"\n[{i}/{len(self.cli.repositories)}] Processing: {repo.name}")
-            self._show_progress(i, len(self.cli.repositories), repo.name, "Repairing")
+        broken_names = {repo.name for repo in broken_repos}
 
-            success, message, _ = self._sync_single_repository(repo, "sync")
+        for repo, success, message in self._iter_parallel(
+                repositories, lambda r: self._sync_one(r, "sync"), "Processing", "Repairing"):
 
             result = {
                 "repo": repo.name,
                 "success": success,
                 "message": message,
-                "was_broken": repo in broken_repos
+                "was_broken": repo.name in broken_names
             }
             stats["results"].append(result)
 
             if success:
-                if "repaired" in message.lower() or "re-cloned" in message.lower():
+                message_lc = message.lower()
+                if "repaired" in message_lc or "re-cloned" in message_lc:
                     stats["repaired"] += 1
                     stats["successful"] += 1
                     if message == 'Already up to date':
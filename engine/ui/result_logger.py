@@ -10,6 +10,8 @@ from engine.utils.text_decorator import Colors, print_success
 class ResultLogger:
     def __init__(self):
         self.results: List[Dict[str, Any]] = []
+        self._successful = 0
+        self._failed = 0
 
     def log_result(self, success: bool, message: str, data: Dict[str, Any] = None) -> bool:
         result = {
@@ -19,15 +21,21 @@ class ResultLogger:
             "data": data or {}
         }
         self.results.append(result)
+        if success:
+            self._successful += 1
+        else:
+            self._failed += 1
 
         print_success(f"{message}")
 
         if data and success:
+            lines = []
             for key, value in data.items():
                 if isinstance(value, (list, dict)) and len(str(value)) > 50:
-                    print(f"    {Colors.YELLOW}{key}:{Colors.END} {len(value)} items")
+                    lines.append(f"    {Colors.YELLOW}{key}:{Colors.END} {len(value)} items")
                 else:
-                    print(f"    {Colors.YELLOW}{key}:{Colors.END} {value}")
+                    lines.append(f"    {Colors.YELLOW}{key}:{Colors.END} {value}")
+            print("\n".join(lines))
 
         return success
 
@@ -37,8 +45,8 @@ class ResultLogger:
         results_data = {
             "checkup_timestamp": datetime.now().isoformat(),
             "total_steps": len(self.results),
-            "successful_steps": sum(1 for r in self.results if r["success"]),
-            "failed_steps": sum(1 for r in self.results if not r["success"]),
+            "successful_steps": self._successful,
+            "failed_steps": self._failed,
             "steps": self.results,
             "username": username
         }
@@ -46,16 +54,18 @@ class ResultLogger:
         results_dir.mkdir(parents=True, exist_ok=True)
 
         with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(results_data, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(results_data, separators=(',', ':')))
 
         print_success(f"Results saved to: {results_file}")
         return results_file
 
     def clear(self):
         self.results.clear()
+        self._successful = 0
+        self._failed = 0
 
     def get_summary(self) -> Dict[str, Any]:
-        successful = sum(1 for r in self.results if r["success"]) // 2
+        successful = self._successful // 2
         total = len(self.results) // 2
 
         return {
@@ -1,6 +1,7 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 
@@ -21,13 +22,19 @@ class UIStateManager:
             'total_private': 0,
             'total_public': 0,
             'total_archived': 0,
-            'total_forks': 0,
-            'last_update': None
+            'total_forks': 0
         }
+        self._last_update_wall: Optional[float] = None
+
+    @property
+    def last_update(self) -> Optional[str]:
+        if self._last_update_wall is None:
+            return None
+        return datetime.fromtimestamp(self._last_update_wall).isoformat()
 
     def update(self, **kwargs):
         self.state.update(kwargs)
-        self.state['last_update'] = datetime.now().isoformat()
+        self._last_update_wall = time.time()
         return self
 
     def get_all_repositories(self, repos):
@@ -55,15 +62,17 @@ class UIStateManager:
 
     def bulk_update(self, data: Dict[str, Any]):
         self.state.update(data)
-        self.state['last_update'] = datetime.now().isoformat()
+        self._last_update_wall = time.time()
         return self
 
     def get(self, key: str, default: Any = None) -> Any:
+        if key == 'last_update':
+            return self.last_update
         return self.state.get(key, default)
 
     def set(self, key: str, value: Any):
         self.state[key] = value
-        self.state['last_update'] = datetime.now().isoformat()
+        self._last_update_wall = time.time()
         return self
 
     def reset(self):
@@ -79,5 +88,5 @@ class UIStateManager:
                 'needs_update': self.state.get('needs_update_count', 0)
             },
             'storage_mb': self.state.get('storage_size_mb', 0),
-            'last_update': self.state.get('last_update')
+            'last_update': self.last_update
         }
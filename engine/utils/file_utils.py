@@ -0,0 +1,70 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Union
+
+log = logging.getLogger(__name__)
+
+
+def _fast_rmtree(path: str):
+    with os.scandir(path) as it:
+        entries = list(it)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            _fast_rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+    os.rmdir(path)
+
+
+class FileUtils:
+    @staticmethod
+    def safe_delete_directory(path: Union[str, Path]) -> bool:
+        try:
+            _fast_rmtree(os.fspath(path))
+            return True
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.debug("fast delete failed for %s, retrying with shutil.rmtree: %s", path, e)
+
+        try:
+            shutil.rmtree(path)
+            return True
+        except FileNotFoundError:
+            return True
+        except OSError as e:
+            log.debug("safe_delete_directory failed for %s: %s", path, e)
+            return False
+
+    @staticmethod
+    def delete_directories_parallel(paths: Iterable[Union[str, Path]], workers: int = 8) -> int:
+        paths = list(paths)
+
+        if len(paths) <= 1:
+            return sum(FileUtils.safe_delete_directory(path) for path in paths)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            return sum(executor.map(FileUtils.safe_delete_directory, paths))
+
+    @staticmethod
+    def safe_delete_directory_parallel(path: Union[str, Path], workers: int = 8) -> bool:
+        path = os.fspath(path)
+
+        try:
+            with os.scandir(path) as it:
+                subdirs = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            return True
+        except OSError as e:
+            log.debug("safe_delete_directory_parallel cannot list %s: %s", path, e)
+            return False
+
+        FileUtils.delete_directories_parallel(subdirs, workers)
+
+        return FileUtils.safe_delete_directory(path)
@@ -1,15 +1,36 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import sys
+
 from engine.utils.text_decorator import Colors, print_error
 
+_YES = frozenset(('y', 'yes'))
+_NO = frozenset(('n', 'no'))
+
+_USE_RAW_STDIN = sys.stdin is not None and not sys.stdin.isatty()
+
+
+def _read(prompt: str) -> str:
+    if _USE_RAW_STDIN:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+    return input(prompt)
+
 
 class InputHandler:
     @staticmethod
     def get_menu_choice(prompt: str, min_choice: int, max_choice: int):
+        prompt_str = f"\n{Colors.CYAN}{prompt} [{min_choice}-{max_choice}]: {Colors.END}"
+        range_err = f"Please enter a number between {min_choice} and {max_choice}"
         while True:
             try:
-                choice_str = input(f"\n{Colors.CYAN}{prompt} [{min_choice}-{max_choice}]: {Colors.END}").strip()
+                choice_str = _read(prompt_str).strip()
 
-                if not choice_str:
+                digits = choice_str[1:] if choice_str[:1] == '-' else choice_str
+                if not digits.isdecimal():
                     print_error("Please enter a number")
                     continue
 
@@ -18,21 +39,20 @@ class InputHandler:
                 if min_choice <= choice <= max_choice:
                     return choice
                 else:
-                    print_error(f"Please enter a number between {min_choice} and {max_choice}")
+                    print_error(range_err)
 
-            except ValueError:
-                print_error("Please enter a number")
             except (KeyboardInterrupt, EOFError):
                 return 0
 
     @staticmethod
     def ask_yes_no(question: str) -> bool:
+        prompt_str = f"\n{Colors.CYAN}{question} (y/n): {Colors.END}"
         while True:
-            response = input(f"\n{Colors.CYAN}{question} (y/n): {Colors.END}").strip().lower()
+            response = _read(prompt_str).strip().lower()
 
-            if response in ['y', 'yes']:
+            if response in _YES:
                 return True
-            elif response in ['n', 'no']:
+            elif response in _NO:
                 return False
             else:
                 print_error("Please answer 'y' or 'n'")
@@ -1,48 +1,166 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-import requests
-import socket
-from typing import Optional
-import ipaddress
+import functools
+import itertools
+import logging
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from ipaddress import IPv4Address, IPv6Address
+
+log = logging.getLogger(__name__)
+
+_IPV4_RE = re.compile(r'(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)', re.ASCII)
+
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+    return _SESSION
+
+
+def _timed_get(session, url: str) -> Tuple[object, float]:
+    start = time.monotonic()
+    response = session.get(url, timeout=NetworkUtils._REQUEST_TIMEOUT)
+    return response, time.monotonic() - start
 
 
 class NetworkUtils:
+    _CACHE_TTL = 300.0
+    _REQUEST_TIMEOUT = (1.0, 2.0)
+    _LOOKUP_DEADLINE = 5.0
+    _FAILED_LATENCY = 10.0
+    _HEDGE_FIRST = 2
+    _HEDGE_DELAY = 0.5
+    _IP_SERVICES = (
+        "https://api.ipify.org",
+        "https://icanhazip.com",
+        "https://ident.me",
+        "https://checkip.amazonaws.com",
+        "https://ifconfig.me/ip"
+    )
+    _service_stats: Dict[str, float] = {url: 0.0 for url in _IP_SERVICES}
+    _cached_ip: Optional[str] = None
+    _cache_expiry: float = 0.0
+
+    @classmethod
+    def invalidate_cache(cls):
+        cls._cached_ip = None
+        cls._cache_expiry = 0.0
+
     @staticmethod
     def get_external_ip() -> Optional[str]:
-        ip_services = [
-            "https://api.ipify.org",
-            "https://icanhazip.com",
-            "https://ident.me",
-            "https://checkip.amazonaws.com",
-            "https://ifconfig.me/ip"
-        ]
-
-        for service in ip_services:
-            try:
-                response = requests.get(service, timeout=3)
-                if response.status_code == 200:
-                    ip = response.text.strip()
-                    if NetworkUtils.is_valid_ip(ip):
-                        return ip
-            except Exception as e:
-                print(e)
-                continue
+        now = time.monotonic()
+        if NetworkUtils._cached_ip and now < NetworkUtils._cache_expiry:
+            return NetworkUtils._cached_ip
+
+        ip = NetworkUtils._lookup_external_ip()
+        if ip and not ip.endswith(" (local)"):
+            NetworkUtils._cached_ip = ip
+            NetworkUtils._cache_expiry = now + NetworkUtils._CACHE_TTL
+        return ip
+
+    @staticmethod
+    def _lookup_external_ip() -> Optional[str]:
+        stats = NetworkUtils._service_stats
+        ip_services = sorted(NetworkUtils._IP_SERVICES, key=lambda url: stats.get(url, 0.0))
+
+        session = _get_session()
+        executor = ThreadPoolExecutor(max_workers=len(ip_services))
+        pending = iter(ip_services)
+        in_flight = {}
+        hedged = False
+        deadline = time.monotonic() + NetworkUtils._LOOKUP_DEADLINE
+
+        def launch(count: int):
+            for service in itertools.islice(pending, count):
+                in_flight[executor.submit(_timed_get, session, service)] = service
+
+        launch(NetworkUtils._HEDGE_FIRST)
 
         try:
-            hostname = socket.gethostname()
-            ip_address = socket.gethostbyname(hostname)
-            if NetworkUtils.is_valid_ip(ip_address):
-                return f"{ip_address} (local)"
-        except Exception as e:
-            print(e)
-            pass
+            while in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                timeout = remaining if hedged else min(remaining, NetworkUtils._HEDGE_DELAY)
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                if not done:
+                    if hedged:
+                        break
+                    launch(len(ip_services))
+                    hedged = True
+                    continue
 
+                for future in done:
+                    service = in_flight.pop(future)
+                    try:
+                        response, elapsed = future.result()
+                        if response.status_code == 200:
+                            parsed = NetworkUtils.parse_ip(response.text.strip())
+                            if parsed is not None:
+                                previous = stats.get(service, 0.0)
+                                stats[service] = 0.7 * previous + 0.3 * elapsed if previous else elapsed
+                                return str(parsed)
+                        stats[service] = NetworkUtils._FAILED_LATENCY
+                    except Exception as e:
+                        stats[service] = NetworkUtils._FAILED_LATENCY
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("ip service %s failed: %s", service, e)
+
+                if not hedged:
+                    launch(len(done))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return NetworkUtils._local_fallback()
+
+    @staticmethod
+    def _local_fallback() -> Optional[str]:
+        local = _resolve_local()
+        if local:
+            return f"{local} (local)"
         return None
 
     @staticmethod
-    def is_valid_ip(ip: str) -> bool:
+    def parse_ip(ip: str) -> Optional[Union['IPv4Address', 'IPv6Address']]:
+        import ipaddress
+
         try:
-            clean_ip = ip.split(' ')[0]
-            ipaddress.ip_address(clean_ip)
-            return True
+            return ipaddress.ip_address(ip.split(' ', 1)[0])
         except ValueError:
-            return False
+            return None
+
+    @staticmethod
+    def is_valid_ip(ip: str) -> bool:
+        clean_ip = ip.split(' ', 1)[0]
+
+        if _IPV4_RE.fullmatch(clean_ip):
+            return True
+
+        return NetworkUtils.parse_ip(clean_ip) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_local() -> Optional[str]:
+    import socket
+
+    try:
+        ip_address = socket.gethostbyname(socket.gethostname())
+    except Exception as e:
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("local address lookup failed: %s", e)
+        return None
+
+    return ip_address if NetworkUtils.is_valid_ip(ip_address) else None
@@ -1,5 +1,9 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import functools
+import io
 import os
+import sys
+from contextlib import contextmanager, redirect_stdout
 from typing import List
 
 class Colors:
@@ -59,41 +63,80 @@ class Icons:
     FILTER = "🔍"
 
 
+_SECTION_OPEN = f"\n{Colors.BOLD}{Colors.BLUE}"
+_SUBSECTION_FMT = f"\n{Colors.BOLD}{Colors.BLUE}▶ {{}}{Colors.END}"
+_SUCCESS_FMT = f"{Colors.GREEN}{{}} {{}}{Colors.END}"
+_ERROR_FMT = f"{Colors.RED}{{}} {{}}{Colors.END}"
+_WARNING_FMT = f"{Colors.YELLOW}{{}} {{}}{Colors.END}"
+_INFO_FMT = f"{Colors.CYAN}{{}} {{}}{Colors.END}"
+_MENU_ITEM_FMT = f"  {Colors.BOLD}{Colors.BLUE}{{}}.{Colors.END} {{}} {{}}"
+_MENU_ITEM_PLAIN_FMT = f"  {Colors.BOLD}{Colors.BLUE}{{}}.{Colors.END} {{}}"
+_WAIT_FMT = f"\n{Colors.YELLOW}{{}}{Colors.END}"
+
+
+_CLEAR_SEQ = '\033[2J\033[H' if (os.name != 'nt' or 'WT_SESSION' in os.environ or os.environ.get('TERM')) else None
+
+
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _CLEAR_SEQ:
+        sys.stdout.write(_CLEAR_SEQ)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+
+def print_frame(frame: str):
+    if _CLEAR_SEQ:
+        sys.stdout.write(_CLEAR_SEQ + frame)
+    else:
+        os.system('cls')
+        sys.stdout.write(frame)
+    sys.stdout.flush()
+
+
+@contextmanager
+def frame_output():
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        yield
+    print_frame(buffer.getvalue())
+
+
+@functools.lru_cache(maxsize=64)
+def _section_header(title: str, width: int) -> str:
+    rule = '=' * width
+    return f"{_SECTION_OPEN}{rule}\n{title.center(width)}\n{rule}{Colors.END}"
 
 
 def print_section(title: str, width: int = 60):
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * width}")
-    print(f"{title.center(width)}")
-    print(f"{'=' * width}{Colors.END}")
+    print(_section_header(title, width))
 
 
 def print_subsection(title: str):
-    print(f"\n{Colors.BOLD}{Colors.BLUE}▶ {title}{Colors.END}")
+    print(_SUBSECTION_FMT.format(title))
 
 
 def print_success(text: str, icon: str = Icons.SUCCESS):
-    print(f"{Colors.GREEN}{icon} {text}{Colors.END}")
+    print(_SUCCESS_FMT.format(icon, text))
 
 
 def print_error(text: str, icon: str = Icons.ERROR):
-    print(f"{Colors.RED}{icon} {text}{Colors.END}")
+    print(_ERROR_FMT.format(icon, text))
 
 
 def print_warning(text: str, icon: str = Icons.WARNING):
-    print(f"{Colors.YELLOW}{icon} {text}{Colors.END}")
+    print(_WARNING_FMT.format(icon, text))
 
 
 def print_info(text: str, icon: str = Icons.INFO):
-    print(f"{Colors.CYAN}{icon} {text}{Colors.END}")
+    print(_INFO_FMT.format(icon, text))
 
 
 def print_menu_item(number: str, text: str, icon: str = ""):
     if icon:
-        print(f"  {Colors.BOLD}{Colors.BLUE}{number}.{Colors.END} {icon} {text}")
+        print(_MENU_ITEM_FMT.format(number, icon, text))
     else:
-        print(f"  {Colors.BOLD}{Colors.BLUE}{number}.{Colors.END} {text}")
+        print(_MENU_ITEM_PLAIN_FMT.format(number, text))
 
 
 def print_table(headers: List[str], rows: List[List], max_width: int = 60):
@@ -101,32 +144,35 @@ def print_table(headers: List[str], rows: List[List], max_width: int = 60):
         print_info("No data to display")
         return
 
-    col_widths = []
-    for i in range(len(headers)):
-        max_len = len(str(headers[i]))
-        for row in rows:
-            if i < len(row):
-                max_len = max(max_len, len(str(row[i])))
-        col_widths.append(min(max_len, max_width))
+    ncols = len(headers)
+    col_widths = [len(str(h)) for h in headers]
+    str_rows = []
+    for row in rows:
+        cells = [str(cell) for cell in row[:ncols]]
+        for i, cell_str in enumerate(cells):
+            if len(cell_str) > col_widths[i]:
+                col_widths[i] = len(cell_str)
+        str_rows.append(cells)
+    col_widths = [min(w, max_width) for w in col_widths]
 
     header_line = " | ".join(
         f"{Colors.BOLD}{str(h).ljust(col_widths[i])[:max_width]}{Colors.END}"
         for i, h in enumerate(headers)
     )
-    print(f"\n{header_line}")
-    print("-+-".join("-" * width for width in col_widths))
+    lines = [f"\n{header_line}", "-+-".join("-" * width for width in col_widths)]
 
-    for row in rows:
+    for cells in str_rows:
         display_row = []
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                cell_str = str(cell)
-                if len(cell_str) > max_width:
-                    cell_str = cell_str[:max_width - 3] + "..."
-                display_row.append(cell_str.ljust(col_widths[i])[:max_width])
-        print(" | ".join(display_row))
+        for i, cell_str in enumerate(cells):
+            if len(cell_str) > max_width:
+                cell_str = cell_str[:max_width - 3] + "..."
+            display_row.append(cell_str.ljust(col_widths[i])[:max_width])
+        lines.append(" | ".join(display_row))
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def wait_for_enter(prompt: str = "Press Enter to continue..."):
-    print(f"\n{Colors.YELLOW}{prompt}{Colors.END}", end="")
+    print(_WAIT_FMT.format(prompt), end="")
     input()